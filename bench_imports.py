@@ -0,0 +1,56 @@
+# import-time benchmark for the custom modules.
+# each module is imported cold in a fresh python process and has to stay under its budget
+# (seconds, on top of plain interpreter startup) without pulling in the heavy libraries.
+#
+#   python bench_imports.py
+
+import os
+import subprocess
+import sys
+import time
+
+BUDGETS = {'wrangle': 1.0, 'explore': 1.0, 'viz': 1.0}
+HEAVY = ['matplotlib', 'seaborn', 'scipy', 'sklearn', 'env']
+REPEATS = 5
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+CHECK = '''
+import sys, {module}
+loaded = [name for name in {heavy!r} if name in sys.modules]
+if loaded:
+    sys.exit('{module} imported ' + ', '.join(loaded) + ' on import')
+'''
+
+def cold_import_time(code):
+    '''
+    Best of REPEATS runs of code in a fresh python process, in seconds.
+    '''
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True, cwd=HERE)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def run_benchmark(budgets=BUDGETS):
+    '''
+    Prints the cold import time of each module and returns the modules that went over budget
+    (or imported a heavy library).
+    '''
+    startup = cold_import_time('pass')
+    failed = []
+    for module, budget in budgets.items():
+        try:
+            seconds = cold_import_time(CHECK.format(module=module, heavy=HEAVY)) - startup
+        except subprocess.CalledProcessError:
+            print(f'{module:<10} FAILED (see error above)')
+            failed.append(module)
+            continue
+        status = 'ok' if seconds <= budget else 'OVER BUDGET'
+        print(f'{module:<10} {seconds:.3f}s (budget {budget:.1f}s) {status}')
+        if seconds > budget:
+            failed.append(module)
+    return failed
+
+if __name__ == '__main__':
+    sys.exit(1 if run_benchmark() else 0)
@@ -0,0 +1,221 @@
+# batch (headless) version of explore_univariate / explore_bivariate / explore_multivariate.
+# builds the same plots and stats tables, but renders them with the Agg backend across a
+# process pool and writes them to an output directory with an index.html, instead of plt.show().
+#
+#   import eda_report
+#   eda_report.render_eda_report(train, 'target', cat_vars, quant_vars, out_dir='eda_report')
+
+import contextlib
+import hashlib
+import html
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+MANIFEST = 'manifest.json'
+
+
+def build_jobs(target, cat_vars, quant_vars):
+    '''
+    Returns the list of (kind, var) jobs for a full EDA pass, in the same order
+    explore_univariate, explore_bivariate and explore_multivariate go through them.
+    '''
+    jobs = [('univariate_categorical', var) for var in cat_vars]
+    jobs += [('univariate_quant', var) for var in quant_vars]
+    jobs += [('bivariate_categorical', var) for var in cat_vars]
+    jobs += [('bivariate_quant', var) for var in quant_vars]
+    if cat_vars:
+        jobs += [('swarm_grid', var) for var in quant_vars]
+        jobs += [('violin_grid', var) for var in quant_vars]
+    if quant_vars:
+        jobs += [('pairplot', 'all'), ('all_continuous', 'all')]
+    return jobs
+
+def job_columns(kind, var, target, cat_vars, quant_vars):
+    '''
+    The columns of train a job actually reads (only these get sent to the worker and hashed).
+    '''
+    if kind.startswith('univariate'):
+        return [var]
+    if kind.startswith('bivariate'):
+        return [var, target]
+    if kind in ('swarm_grid', 'violin_grid'):
+        return list(dict.fromkeys([var, target, *cat_vars]))
+    return list(dict.fromkeys([*quant_vars, target]))
+
+def job_name(kind, var):
+    return f'{kind}__{var}'
+
+def job_key(data, kind, var, target, cat_vars, formats):
+    '''
+    Hash of everything that goes into a job's output: the data it reads and how it's plotted.
+    If this hasn't changed since the last run, the job is skipped.
+    '''
+    h = hashlib.sha256()
+    h.update(json.dumps([kind, var, target, list(cat_vars), list(data.columns),
+                         list(formats)]).encode())
+    h.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def render_job(data, kind, var, target, cat_vars, quant_vars, out_dir, formats):
+    '''
+    Runs in a worker process: makes one job's figures and tables with the Agg backend,
+    saves them in out_dir and returns the relative paths that were written.
+    '''
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import explore as e
+
+    name = job_name(kind, var)
+    tables = {}
+
+    # workers are reused between jobs, so start from no open figures and close them
+    # again whatever happens, otherwise one job's figures get saved under the next job's name
+    plt.close('all')
+    try:
+        # the explore functions print their tables and call plt.show(), which does nothing on Agg,
+        # so the printing is swallowed and the open figures are collected after the call
+        with contextlib.redirect_stdout(io.StringIO()):
+            if kind == 'univariate_categorical':
+                tables['frequency'] = e.freq_table(data, var)
+                e.explore_univariate_categorical(data, var)
+            elif kind == 'univariate_quant':
+                _, tables['describe'] = e.explore_univariate_quant(data, var)
+            elif kind == 'bivariate_categorical':
+                chi2_summary, observed, expected = e.run_chi2(data, var, target)
+                tables['chi2'] = chi2_summary
+                tables['observed'] = pd.crosstab(data[var], data[target], margins=True)
+                tables['expected'] = expected
+                e.explore_bivariate_categorical(data, target, var)
+            elif kind == 'bivariate_quant':
+                tables['describe'] = data.groupby(target)[var].describe()
+                mann_whitney = e.compare_means(data, target, var)
+                tables['mann_whitney'] = pd.DataFrame({'statistic': [mann_whitney.statistic],
+                                                       'p-value': [mann_whitney.pvalue]})
+                e.explore_bivariate_quant(data, target, var)
+            elif kind == 'swarm_grid':
+                e.plot_swarm_grid_with_color(data, target, cat_vars, [var])
+            elif kind == 'violin_grid':
+                e.plot_violin_grid_with_color(data, target, cat_vars, [var])
+            elif kind == 'pairplot':
+                e.sns.pairplot(data=data, vars=quant_vars, hue=target)
+            elif kind == 'all_continuous':
+                e.plot_all_continuous_vars(data, target, quant_vars)
+            else:
+                raise ValueError(f'unknown job kind: {kind}')
+
+        figures = []
+        for i, num in enumerate(plt.get_fignums()):
+            fig = plt.figure(num)
+            for fmt in formats:
+                path = os.path.join('figures', f'{name}_{i}.{fmt}')
+                fig.savefig(os.path.join(out_dir, path), bbox_inches='tight')
+                figures.append(path)
+    finally:
+        plt.close('all')
+
+    table_paths = []
+    for table_name, table in tables.items():
+        path = os.path.join('tables', f'{name}_{table_name}.csv')
+        pd.DataFrame(table).to_csv(os.path.join(out_dir, path))
+        table_paths.append(path)
+
+    return {'figures': figures, 'tables': table_paths}
+
+
+def write_index(out_dir, jobs, manifest, failures=None):
+    '''
+    Writes index.html with every job's figures and tables, in job order,
+    plus a list of the jobs that failed (job name -> error) at the top.
+    '''
+    parts = ['<html><head><meta charset="utf-8"><title>EDA report</title></head><body>',
+             '<h1>EDA report</h1>']
+    if failures:
+        parts.append('<h2>failed</h2><ul>')
+        for name, error in failures.items():
+            parts.append(f'<li>{html.escape(name)}: {html.escape(error)}</li>')
+        parts.append('</ul>')
+    section = None
+    for kind, var in jobs:
+        entry = manifest.get(job_name(kind, var))
+        if entry is None:
+            continue
+        if kind != section:
+            section = kind
+            parts.append(f'<h2>{html.escape(kind.replace("_", " "))}</h2>')
+        parts.append(f'<h3>{html.escape(str(var))}</h3>')
+        # show the pngs if there are any, otherwise the svgs
+        images = [p for p in entry['figures'] if p.endswith('.png')] or entry['figures']
+        for path in images:
+            parts.append(f'<img src="{html.escape(path)}">')
+        for path in entry['tables']:
+            table = pd.read_csv(os.path.join(out_dir, path), index_col=0)
+            parts.append(f'<p><a href="{html.escape(path)}">{html.escape(os.path.basename(path))}</a></p>')
+            parts.append(table.to_html())
+    parts.append('</body></html>')
+
+    with open(os.path.join(out_dir, 'index.html'), 'w') as f:
+        f.write('\n'.join(parts))
+
+def render_eda_report(train, target, cat_vars, quant_vars, out_dir='eda_report',
+                      formats=('png',), n_jobs=None):
+    '''
+    Headless batch version of explore_univariate, explore_bivariate and explore_multivariate.
+    - renders every figure with the Agg backend, spread over a process pool (n_jobs workers)
+    - writes figures (png and/or svg) to out_dir/figures and stats tables to out_dir/tables
+    - writes out_dir/index.html to browse it all
+    - skips any job whose input columns haven't changed since the last run
+    Returns a dict of job name -> 'rendered', 'skipped' or 'failed: <the error>'.
+    '''
+    os.makedirs(os.path.join(out_dir, 'figures'), exist_ok=True)
+    os.makedirs(os.path.join(out_dir, 'tables'), exist_ok=True)
+
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    else:
+        manifest = {}
+
+    jobs = build_jobs(target, cat_vars, quant_vars)
+    status = {}
+    futures = {}
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        for kind, var in jobs:
+            name = job_name(kind, var)
+            data = train[job_columns(kind, var, target, cat_vars, quant_vars)]
+            key = job_key(data, kind, var, target, cat_vars, formats)
+
+            entry = manifest.get(name)
+            if (entry is not None and entry['key'] == key and
+                    all(os.path.exists(os.path.join(out_dir, p))
+                        for p in entry['figures'] + entry['tables'])):
+                status[name] = 'skipped'
+                continue
+
+            futures[name] = (key, pool.submit(render_job, data, kind, var, target,
+                                              list(cat_vars), list(quant_vars), out_dir,
+                                              list(formats)))
+
+        # one failed job shouldn't lose the rest of the report, so each error is recorded
+        # (and the job dropped from the manifest so it's rendered again next run)
+        failures = {}
+        for name, (key, future) in futures.items():
+            try:
+                manifest[name] = {'key': key, **future.result()}
+                status[name] = 'rendered'
+            except Exception as err:
+                manifest.pop(name, None)
+                failures[name] = f'{type(err).__name__}: {err}'
+                status[name] = f'failed: {failures[name]}'
+
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    write_index(out_dir, jobs, manifest, failures)
+
+    return status
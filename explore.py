@@ -1,12 +1,17 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
+from lazy_imports import LazyModule, use_style
 
-plt.style.use(
-    "https://github.com/dhaitz/matplotlib-stylesheets/raw/master/pitayasmoothie-dark.mplstyle"
-)
+# matplotlib, seaborn and scipy are imported the first time they're used, not on import.
+# the style sheet is applied when plotting starts (read from a local copy, see lazy_imports.py)
+plt = LazyModule('matplotlib.pyplot', on_load=use_style)
+
+def _start_plotting(sns):
+    # seaborn plots can come before any plt call, so make sure the style is applied
+    plt.style
+
+sns = LazyModule('seaborn', on_load=_start_plotting)
+stats = LazyModule('scipy.stats')
 
 #####
 def plot_variable_pairs(df):
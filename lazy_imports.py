@@ -0,0 +1,86 @@
+# helpers so explore.py, viz.py and wrangle.py can be imported quickly (and offline).
+# the heavy libraries (matplotlib, seaborn, scipy, sklearn) only get imported the first
+# time one of their attributes is used, and the plot style only gets applied then too.
+
+import importlib
+import os
+import tempfile
+import warnings
+
+STYLE_URL = "https://github.com/dhaitz/matplotlib-stylesheets/raw/master/pitayasmoothie-dark.mplstyle"
+STYLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pitayasmoothie-dark.mplstyle')
+
+# set after a failed download so an offline process only waits on the network once
+_download_failed = False
+
+
+class LazyModule:
+    '''
+    Stand-in for a module that is imported on first attribute access.
+
+    plt = LazyModule('matplotlib.pyplot') works like import matplotlib.pyplot as plt,
+    except nothing is imported until something like plt.figure is used.
+    on_load is called once with the real module right after it is imported.
+    '''
+    def __init__(self, name, on_load=None):
+        self._name = name
+        self._on_load = on_load
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            module = importlib.import_module(self._name)
+            self._module = module
+            if self._on_load is not None:
+                self._on_load(module)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        status = 'loaded' if self._module is not None else 'not loaded'
+        return f'<LazyModule {self._name!r} ({status})>'
+
+
+def use_style(plt, style_file=None, url=STYLE_URL, timeout=5):
+    '''
+    Applies the pitayasmoothie-dark style sheet from a local copy.
+    - Set the MPL_STYLE_FILE environment variable to point at your own copy of the sheet.
+    - Otherwise the copy next to this file is used; if it's missing it's downloaded once and cached there.
+    - If that fails (offline workers), warns and keeps matplotlib's default style instead of erroring,
+      and doesn't try the download again in this process.
+    '''
+    global _download_failed
+
+    if style_file is None:
+        style_file = os.environ.get('MPL_STYLE_FILE')
+    if style_file is not None:
+        if os.path.exists(style_file):
+            plt.style.use(style_file)
+        else:
+            warnings.warn(f'style sheet {style_file} not found, using the default matplotlib style')
+        return
+
+    if not os.path.exists(STYLE_FILE):
+        if _download_failed:
+            return
+        try:
+            from urllib.request import urlopen
+            with urlopen(url, timeout=timeout) as response:
+                sheet = response.read()
+            # write to a temp file and move it into place, so a process starting at the same
+            # time never reads a half written sheet
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(STYLE_FILE), suffix='.mplstyle')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(sheet)
+                os.replace(tmp, STYLE_FILE)
+            except OSError:
+                os.remove(tmp)
+                raise
+        except OSError as err:
+            _download_failed = True
+            warnings.warn(f'could not get the style sheet ({err}), using the default matplotlib style')
+            return
+    plt.style.use(STYLE_FILE)
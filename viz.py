@@ -1,10 +1,58 @@
 # creating visualizations to demonstrate other concepts in lessons
 # when the code distracts from the lesson, then the code can be added here.
 
-import matplotlib.pyplot as plt
-plt.rc("axes.spines", top=False, right=False)
-import seaborn as sns
-from sklearn.linear_model import LinearRegression
+import numpy as np
+from lazy_imports import LazyModule
+
+# matplotlib and seaborn are imported the first time they're used, not on import
+def _no_top_right_spines(plt):
+    plt.rc("axes.spines", top=False, right=False)
+
+plt = LazyModule('matplotlib.pyplot', on_load=_no_top_right_spines)
+sns = LazyModule('seaborn')
+
+def residual_segments(x, y, y_from, offset=0):
+    '''
+    Builds an (n, 2, 2) array of vertical line segments from y_from to y at each x.
+    y_from can be an array (like yhat) or a single value (like the baseline).
+    '''
+    x = np.asarray(x, dtype=float) + offset
+    y = np.asarray(y, dtype=float)
+    y_from = np.broadcast_to(np.asarray(y_from, dtype=float), y.shape)
+    return np.stack([np.column_stack([x, y_from]), np.column_stack([x, y])], axis=1)
+
+def plot_residual_lines(x, y, yhat, baseline=None, ax=None, max_lines=2000, seed=123):
+    '''
+    Draws the error lines from the regression line (and optionally the baseline) to each data point.
+    Each series is a single LineCollection so it renders quickly on a full validate split.
+    Past max_lines points a random sample of the lines is drawn and the alpha is scaled down.
+    Returns the LineCollections that were added.
+    '''
+    from matplotlib.collections import LineCollection
+
+    if ax is None:
+        ax = plt.gca()
+    x, y, yhat = np.asarray(x), np.asarray(y), np.asarray(yhat)
+
+    n = len(x)
+    scale = 1.0
+    if max_lines is not None and n > max_lines:
+        idx = np.random.default_rng(seed).choice(n, size=max_lines, replace=False)
+        x, y, yhat = x[idx], y[idx], yhat[idx]
+        scale = max(max_lines / n, .2)
+
+    collections = []
+    if baseline is not None:
+        collections.append(LineCollection(residual_segments(x, y, baseline, offset=.1),
+                                          colors='goldenrod', linestyles='--',
+                                          linewidths=2, alpha=.5 * scale))
+    collections.append(LineCollection(residual_segments(x, y, yhat),
+                                      colors='darkseagreen', linestyles='--',
+                                      linewidths=2, alpha=.75 * scale))
+    for lc in collections:
+        ax.add_collection(lc)
+    ax.autoscale_view()
+    return collections
 
 def evaluation_example1(df, x, y):
     plt.figure(figsize=(8, 5))
@@ -106,15 +154,9 @@ def evaluation_example3(df, x, y, yhat):
     plt.xlabel('exam 1')
     
     ## ----------------------------------------
-    # annotate each data point with an error line to the baseline and the error value 
-    for i in range(len(df)):
-        
-        # add error lines from baseline to data points
-        plt.annotate('', xy=(x[i]+.1, y[i]), xytext=(x[i]+.1, y.mean()), xycoords='data', textcoords='data', 
-                 arrowprops={'arrowstyle': '-', 'color':'goldenrod', 'linestyle': '--', 'linewidth': 2, 'alpha': .5})
-        # add error lines from regression line to data points      
-        plt.annotate('', xy=(x[i], y[i]), xytext=(x[i], yhat[i]), xycoords='data', textcoords='data', 
-                 arrowprops={'arrowstyle': '-', 'color':'darkseagreen', 'linestyle': '--', 'linewidth': 2, 'alpha': .75})
+    # add error lines from baseline and regression line to each data point
+    # (one LineCollection per series instead of two annotations per point)
+    plot_residual_lines(x, y, yhat, baseline=y.mean())
 
     ## ----------------------------------------
     # annotate some of the error lines with pointers
@@ -1,9 +1,10 @@
 import pandas as pd
 import numpy as np
 
-import env
 import os
-from sklearn.model_selection import train_test_split
+
+# env (your SQL credentials) and sklearn are only imported inside the functions that need them,
+# so reading from the csv cache works without either of them.
 
 def check_file_exists(filename, query, url):
     '''
@@ -42,6 +43,7 @@ def splitting_data(df, seed=123): ### No longer needs the col key argument becau
     Just like the splitting Titanic function but it can be used for any df now!
     must provide the df and column. Does not clean it though
     '''
+    from sklearn.model_selection import train_test_split
 
     #first split
     train, validate_test = train_test_split(df,
@@ -65,7 +67,11 @@ def splitting_data(df, seed=123): ### No longer needs the col key argument becau
 
 
 ##### Read data from the student_grades table in the school_sample database on our mySQL server. #####
-def get_connection(db, user=env.user, host=env.host, password=env.password):
+def get_connection(db, user=None, host=None, password=None):
+    import env
+    user = env.user if user is None else user
+    host = env.host if host is None else host
+    password = env.password if password is None else password
     return f'mysql+pymysql://{user}:{password}@{host}/{db}'
 
 def get_student_data():
@@ -150,6 +156,7 @@ def get_zillow_data():
     
     else:
         # Create the url
+        import env
         url = env.get_db_url('zillow')
         
         sql_query = '''
@@ -187,6 +194,7 @@ def get_zillow_sample_data():
     
     else:
         # Create the url
+        import env
         url = env.get_db_url('zillow')
         
         sql_query = '''
@@ -286,4 +294,120 @@ def wrangle_zillow_sample():
     - return the clean df
     '''
     df_sample = prep_zillow_sample(get_zillow_sample_data())
-    return df_sample
\ No newline at end of file
+    return df_sample
+
+
+##### Feature expansion: polynomial / interaction terms, built in row chunks after prep + scaling #####
+def poly_terms(features, degree=2, interaction_only=False):
+    '''
+    Returns the list of polynomial terms for the given features as tuples of column names.
+    ('area',) is area, ('area', 'area') is area^2, ('area', 'bedrooms') is area*bedrooms.
+    Same ordering as sklearn's PolynomialFeatures (without the bias column).
+    '''
+    from itertools import combinations, combinations_with_replacement
+
+    combine = combinations if interaction_only else combinations_with_replacement
+    terms = []
+    for d in range(1, degree + 1):
+        terms.extend(combine(features, d))
+    return terms
+
+def poly_term_names(terms):
+    '''
+    Turns poly_terms tuples into readable column names, e.g. ('area', 'area') -> 'area^2'.
+    '''
+    names = []
+    for term in terms:
+        parts = []
+        for feature in dict.fromkeys(term):
+            power = term.count(feature)
+            parts.append(feature if power == 1 else f'{feature}^{power}')
+        names.append(' '.join(parts))
+    return names
+
+def poly_feature_chunks(df, features, degree=2, interaction_only=False, terms=None,
+                        chunk_size=50_000, dtype='float32'):
+    '''
+    Generator that yields (start, X_chunk) where X_chunk is the expanded polynomial
+    design matrix for rows start:start+chunk_size, as a numpy array in the given dtype.
+    The full expanded matrix is never built, only one chunk at a time.
+    
+    - df should already be prepped (and scaled, so the squared terms don't overflow float32)
+    - terms: optional list of poly_terms tuples to only build the columns you need
+    '''
+    if terms is None:
+        terms = poly_terms(features, degree, interaction_only)
+    cols = list(dict.fromkeys(f for term in terms for f in term))
+    pos = {col: i for i, col in enumerate(cols)}
+    # select the columns once, doing it per chunk copies every row of them each time
+    sub = df[cols]
+
+    for start in range(0, len(df), chunk_size):
+        base = sub.iloc[start:start + chunk_size].to_numpy(dtype=dtype)
+        X = np.empty((len(base), len(terms)), dtype=dtype)
+        for j, term in enumerate(terms):
+            X[:, j] = base[:, pos[term[0]]]
+            for feature in term[1:]:
+                X[:, j] *= base[:, pos[feature]]
+        yield start, X
+
+def poly_xtx(df, features, target, degree=2, interaction_only=False, terms=None,
+             chunk_size=50_000, dtype='float32'):
+    '''
+    Accumulates X^T X and X^T y for the polynomial design matrix one chunk at a time.
+    A column of ones is added first for the intercept.
+    Sums are kept in float64 so the chunks can be float32 without losing the fit.
+    
+    Pass terms (a subset of poly_terms) to only compute the X^T X blocks for those terms.
+    Returns xtx, xty, terms
+    '''
+    if terms is None:
+        terms = poly_terms(features, degree, interaction_only)
+    k = len(terms) + 1
+    xtx = np.zeros((k, k))
+    xty = np.zeros(k)
+    y = df[target].to_numpy(dtype='float64')
+
+    for start, X in poly_feature_chunks(df, features, terms=terms,
+                                        chunk_size=chunk_size, dtype=dtype):
+        X = np.column_stack([np.ones(len(X), dtype=dtype), X])
+        y_chunk = y[start:start + len(X)]
+        xtx += X.T.astype('float64') @ X
+        xty += X.T.astype('float64') @ y_chunk
+    return xtx, xty, terms
+
+def fit_poly_regression(df, features, target, degree=2, interaction_only=False, terms=None,
+                        chunk_size=50_000, dtype='float32'):
+    '''
+    Fits an ordinary least squares polynomial regression from the chunked X^T X / X^T y sums.
+    Returns the intercept and a Series of coefficients indexed by term name.
+    '''
+    xtx, xty, terms = poly_xtx(df, features, target, degree, interaction_only, terms,
+                               chunk_size, dtype)
+    coef = np.linalg.lstsq(xtx, xty, rcond=None)[0]
+    return coef[0], pd.Series(coef[1:], index=poly_term_names(terms))
+
+def partial_fit_poly(model, df, features, target, degree=2, interaction_only=False, terms=None,
+                     chunk_size=50_000, dtype='float32'):
+    '''
+    Feeds the polynomial chunks straight into a model with partial_fit
+    (like sklearn's SGDRegressor) so the expanded matrix is never built.
+    Returns the fitted model.
+    '''
+    y = df[target].to_numpy()
+    for start, X in poly_feature_chunks(df, features, degree, interaction_only, terms,
+                                        chunk_size, dtype):
+        model.partial_fit(X, y[start:start + len(X)])
+    return model
+
+def predict_poly(intercept, coef, df, features, degree=2, interaction_only=False, terms=None,
+                 chunk_size=50_000, dtype='float32'):
+    '''
+    Predictions from fit_poly_regression's intercept and coefficients, built chunk by chunk.
+    '''
+    yhat = np.empty(len(df))
+    coef = np.asarray(coef, dtype='float64')
+    for start, X in poly_feature_chunks(df, features, degree, interaction_only, terms,
+                                        chunk_size, dtype):
+        yhat[start:start + len(X)] = intercept + X @ coef
+    return yhat